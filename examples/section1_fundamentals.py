@@ -1,9 +1,14 @@
 #!/usr/bin/env python3
 import os, boto3
 from boto3.dynamodb.conditions import Key
-from dotenv import load_dotenv
+from botocore.config import Config
 
-load_dotenv()
+# Variables the setup steps export; .env is parsed only if one is missing
+ENV_VARS = {"AWS_PROFILE", "AWS_REGION", "TABLE"}
+if not ENV_VARS <= os.environ.keys():
+    from dotenv import load_dotenv
+
+    load_dotenv()
 
 REGION = os.environ.get("AWS_REGION", "ap-southeast-1")
 TABLE = os.environ["TABLE"]  # export TABLE=ws-att-<id>
@@ -12,39 +17,56 @@ USER_PK = lambda u: f"USER#{u}"
 PROFILE_SK = lambda u: f"PROFILE#{u}"
 ORDER_SK = lambda ymd, oid: f"ORDER#{ymd}#{oid}"
 
-ddb = boto3.resource("dynamodb", region_name=REGION)
+# Adaptive retries: jittered exponential backoff plus client-side rate
+# limiting when DynamoDB throttles
+cfg = Config(retries={"mode": "adaptive", "max_attempts": 10})
+ddb = boto3.resource("dynamodb", region_name=REGION, config=cfg)
 tbl = ddb.Table(TABLE)
+# Reuse the resource's client (one connection pool); it takes and returns
+# plain Python values, serializing to AttributeValues itself
+client = ddb.meta.client
+
+
+def transact_put(items):
+    # Small seed (TransactWriteItems allows up to 100 items): one atomic call,
+    # so the profile and its orders are all written or none are. It rejects
+    # a request that repeats a key, so keep the last put per PK/SK (what
+    # batch_writer's overwrite_by_pkeys does)
+    items = {(item["PK"], item["SK"]): item for item in items}.values()
+    client.transact_write_items(
+        TransactItems=[{"Put": {"TableName": TABLE, "Item": item}} for item in items]
+    )
+
 
 # Seed related items under ONE PK
-with tbl.batch_writer() as bw:
-    bw.put_item(
-        Item={
+transact_put(
+    [
+        {
             "PK": USER_PK("u123"),
             "SK": PROFILE_SK("u123"),
             "type": "USER",
             "name": "Ada",
-        }
-    )
-    bw.put_item(
-        Item={
+        },
+        {
             "PK": USER_PK("u123"),
             "SK": ORDER_SK("20250927", "o1"),
             "type": "ORDER",
             "status": "PENDING",
-        }
-    )
-    bw.put_item(
-        Item={
+        },
+        {
             "PK": USER_PK("u123"),
             "SK": ORDER_SK("20250928", "o2"),
             "type": "ORDER",
             "status": "SHIPPED",
-        }
-    )
+        },
+    ]
+)
 
 # Efficient: Query one partition
 resp = tbl.query(KeyConditionExpression=Key("PK").eq(USER_PK("u123")))
 print("Query (profile + orders):", resp["Items"])
 
-# Inefficient: Scan the whole table (avoid in real apps)
-print("Scan sample:", tbl.scan(Limit=5)["Items"])
+# Inefficient: Scan reads across the whole table (avoid in real apps); even
+# with Limit=5 it returns an arbitrary sample. The Query above already shows
+# this user's items, so the Scan is kept for comparison only:
+# print("Scan sample:", tbl.scan(Limit=5)["Items"])
@@ -1,36 +1,48 @@
 #!/usr/bin/env python3
-import os, time, boto3
+import os, random, time, boto3
 from boto3.dynamodb.conditions import Key
+from botocore.config import Config
+from botocore.exceptions import ClientError
 
 REGION = os.environ.get("AWS_REGION", "ap-southeast-1")
 TABLE = os.environ["TABLE"]
 GSI_NAME = "GSI1_Status"
-client = boto3.client("dynamodb", region_name=REGION)
 
-desc = client.describe_table(TableName=TABLE)["Table"]
-idx = {i["IndexName"] for i in desc.get("GlobalSecondaryIndexes", []) or []}
-if GSI_NAME not in idx:
-    client.update_table(
-        TableName=TABLE,
-        AttributeDefinitions=[
-            {"AttributeName": "GSI1PK", "AttributeType": "S"},
-            {"AttributeName": "GSI1SK", "AttributeType": "S"},
-        ],
-        GlobalSecondaryIndexUpdates=[
-            {
-                "Create": {
-                    "IndexName": GSI_NAME,
-                    "KeySchema": [
-                        {"AttributeName": "GSI1PK", "KeyType": "HASH"},
-                        {"AttributeName": "GSI1SK", "KeyType": "RANGE"},
-                    ],
-                    "Projection": {"ProjectionType": "ALL"},
+cfg = Config(retries={"mode": "adaptive", "max_attempts": 10})
+# One resource for the whole script; its client handles the table admin calls
+ddb = boto3.resource("dynamodb", region_name=REGION, config=cfg)
+client = ddb.meta.client
+r = ddb.Table(TABLE)
+
+
+def create_gsi_and_wait():
+    desc = client.describe_table(TableName=TABLE)["Table"]
+    idx = {i["IndexName"] for i in desc.get("GlobalSecondaryIndexes", []) or []}
+    if GSI_NAME not in idx:
+        client.update_table(
+            TableName=TABLE,
+            AttributeDefinitions=[
+                {"AttributeName": "GSI1PK", "AttributeType": "S"},
+                {"AttributeName": "GSI1SK", "AttributeType": "S"},
+            ],
+            GlobalSecondaryIndexUpdates=[
+                {
+                    "Create": {
+                        "IndexName": GSI_NAME,
+                        "KeySchema": [
+                            {"AttributeName": "GSI1PK", "KeyType": "HASH"},
+                            {"AttributeName": "GSI1SK", "KeyType": "RANGE"},
+                        ],
+                        "Projection": {"ProjectionType": "ALL"},
+                    }
                 }
-            }
-        ],
-    )
+            ],
+        )
+    # Index backfill takes minutes: poll with jittered exponential backoff
+    delay = 1.0
     while True:
-        time.sleep(3)
+        time.sleep(delay + random.random() * 0.5)
+        delay = min(delay * 1.7, 30)
         gsi = client.describe_table(TableName=TABLE)["Table"].get(
             "GlobalSecondaryIndexes", []
         )
@@ -39,7 +51,27 @@ if GSI_NAME not in idx:
         ):
             break
 
-r = boto3.resource("dynamodb", region_name=REGION).Table(TABLE)
+
+# On re-runs the index already exists, so one cheap query proves it instead of
+# a DescribeTable. Only a missing index ("does not have the specified index",
+# or ResourceNotFoundException on some emulators) or one still backfilling
+# falls back to describing, creating and waiting; other errors surface as-is.
+try:
+    r.query(
+        IndexName=GSI_NAME,
+        KeyConditionExpression=Key("GSI1PK").eq("STATUS#PENDING"),
+        Limit=1,
+    )
+except ClientError as e:
+    err = e.response["Error"]
+    missing = err["Code"] == "ResourceNotFoundException" or (
+        err["Code"] == "ValidationException"
+        and ("specified index" in err["Message"] or "backfilling" in err["Message"])
+    )
+    if not missing:
+        raise
+    create_gsi_and_wait()
+
 r.put_item(
     Item={
         "PK": "USER#u200",
@@ -64,6 +96,10 @@ r.put_item(
 print("PENDING orders across all users in personal table:")
 print(
     r.query(
-        IndexName=GSI_NAME, KeyConditionExpression=Key("GSI1PK").eq("STATUS#PENDING")
+        IndexName=GSI_NAME,
+        KeyConditionExpression=Key("GSI1PK").eq("STATUS#PENDING"),
+        # Only return what we print ("status" is a reserved word)
+        ProjectionExpression="PK, SK, #s",
+        ExpressionAttributeNames={"#s": "status"},
     )["Items"]
 )
@@ -1,8 +1,13 @@
 #!/usr/bin/env python3
-import os, boto3
-from dotenv import load_dotenv
+import os, time, boto3
+from boto3.dynamodb.types import TypeSerializer
+from botocore.config import Config
 
-load_dotenv()
+ENV_VARS = {"AWS_PROFILE", "AWS_REGION", "TABLE"}
+if not ENV_VARS <= os.environ.keys():
+    from dotenv import load_dotenv
+
+    load_dotenv()
 
 REGION = os.environ.get("AWS_REGION", "ap-southeast-1")
 TABLE = os.environ["TABLE"]
@@ -11,41 +16,59 @@ PK_USER = lambda uid: f"USER#{uid}"
 SK_PROFILE = lambda uid: f"PROFILE#{uid}"
 SK_ORDER = lambda ts, oid: f"ORDER#{ts}#{oid}"
 
-ddb = boto3.resource("dynamodb", region_name=REGION)
-tbl = ddb.Table(TABLE)
+cfg = Config(retries={"mode": "adaptive", "max_attempts": 10})
+client = boto3.client("dynamodb", region_name=REGION, config=cfg)
+
+ser = TypeSerializer()
+av = lambda item: {k: ser.serialize(v) for k, v in item.items()}
+
+
+def write_batch(reqs):
+    # Retry leftovers with backoff until DynamoDB has processed the whole batch
+    pending = {TABLE: reqs}
+    for attempt in range(8):
+        if attempt:  # back off before each retry, not after the last try
+            time.sleep(2 ** (attempt - 1) * 0.05)
+        pending = client.batch_write_item(RequestItems=pending)["UnprocessedItems"]
+        if not pending:
+            return
+    raise RuntimeError(f"Unprocessed items left after retries: {pending}")
+
+
+def batch_put(items):
+    # BatchWriteItem takes up to 25 puts per call
+    reqs = [{"PutRequest": {"Item": av(item)}} for item in items]
+    for i in range(0, len(reqs), 25):
+        write_batch(reqs[i : i + 25])
+
 
-with tbl.batch_writer() as bw:
-    bw.put_item(
-        Item={
+batch_put(
+    [
+        {
             "PK": PK_USER("u200"),
             "SK": SK_PROFILE("u200"),
             "type": "USER",
             "email": "ada@example.org",
-        }
-    )
-    bw.put_item(
-        Item={
+        },
+        {
             "PK": PK_USER("u200"),
             "SK": SK_ORDER("20250925", "o100"),
             "type": "ORDER",
             "status": "PENDING",
-        }
-    )
-    bw.put_item(
-        Item={
+        },
+        {
             "PK": PK_USER("u200"),
             "SK": SK_ORDER("20250926", "o101"),
             "type": "ORDER",
             "status": "PENDING",
-        }
-    )
-    bw.put_item(
-        Item={
+        },
+        {
             "PK": PK_USER("u200"),
             "SK": SK_ORDER("20250928", "o102"),
             "type": "ORDER",
             "status": "SHIPPED",
-        }
-    )
+        },
+    ]
+)
 
 print("Seeded single-table items for user u200 in", TABLE)
@@ -1,45 +1,105 @@
 #!/usr/bin/env python3
-import os, random, boto3
-from boto3.dynamodb.conditions import Key
-from dotenv import load_dotenv
+import heapq, os, time, boto3
+from concurrent.futures import ThreadPoolExecutor
+from itertools import cycle, islice
+from operator import itemgetter
+from botocore.config import Config
 
-load_dotenv()
+ENV_VARS = {"AWS_PROFILE", "AWS_REGION", "TABLE"}
+if not ENV_VARS <= os.environ.keys():
+    from dotenv import load_dotenv
+
+    load_dotenv()
 
 REGION = os.environ.get("AWS_REGION", "ap-southeast-1")
 TABLE = os.environ["TABLE"]
 USER_ID = "hotuser"
+EVENTS = 120
 SHARDS = ["S0", "S1", "S2", "S3"]
+WORKERS = 5  # concurrent requests; >= len(SHARDS) so all shards are read at once
+
+# Clients are thread-safe (resources are not): one client and its keep-alive
+# connection pool serve every write and read worker, with adaptive retries
+# backing off on partition throttling. The pool is capped at the worker count,
+# so the seed opens at most WORKERS connections and the fan-out reuses them.
+cfg = Config(
+    max_pool_connections=WORKERS,
+    retries={"mode": "adaptive", "max_attempts": 10},
+    tcp_keepalive=True,
+)
+client = boto3.client("dynamodb", region_name=REGION, config=cfg)
+
+PK_BY_SHARD = {s: f"USER#{USER_ID}#{s}" for s in SHARDS}  # built once
+# Inverted timestamp: the newest event gets the smallest SK, so a plain
+# (ascending) Query already returns newest first. The REVT# prefix keeps these
+# apart from EVENT#<ts> items written by earlier runs in the same partitions.
+MAX_TS = 10**10 - 1
+SK_PREFIX = "REVT#"
+SK = lambda ts, n: f"{SK_PREFIX}{MAX_TS - ts:010d}#{n:06d}"
+
+
+def write_batch(reqs):
+    # Retry leftovers with backoff until DynamoDB has processed the whole batch
+    pending = {TABLE: reqs}
+    for attempt in range(8):
+        if attempt:  # back off before each retry, not after the last try
+            time.sleep(2 ** (attempt - 1) * 0.05)
+        pending = client.batch_write_item(RequestItems=pending)["UnprocessedItems"]
+        if not pending:
+            return
+    raise RuntimeError(f"Unprocessed items left after retries: {pending}")
+
 
-ddb = boto3.resource("dynamodb", region_name=REGION)
-tbl = ddb.Table(TABLE)
-
-PK = lambda s: f"USER#{USER_ID}#{s}"
-SK = lambda ts, n: f"EVENT#{ts:010d}#{n:06d}"
-
-# Write across shards
-with tbl.batch_writer() as bw:
-    for n in range(120):
-        s = random.choice(SHARDS)
-        bw.put_item(
-            Item={
-                "PK": PK(s),
-                "SK": SK(n, n),
-                "type": "EVENT",
-                "payload": {"n": n, "shard": s},
-            }
-        )
-
-# Fan-out reads and merge
-items = []
-for s in SHARDS:
-    resp = tbl.query(
-        KeyConditionExpression=Key("PK").eq(PK(s)), ScanIndexForward=False, Limit=50
+def batch_put(pool, items):
+    # BatchWriteItem takes up to 25 puts per call; send the batches in parallel.
+    reqs = [{"PutRequest": {"Item": item}} for item in items]
+    batches = [reqs[i : i + 25] for i in range(0, len(reqs), 25)]
+    list(pool.map(write_batch, batches))  # re-raises any batch failure
+
+
+# Fan-out reads: shard queries are independent, so issue them in parallel
+def query_shard(s):
+    resp = client.query(
+        TableName=TABLE,
+        KeyConditionExpression="PK = :pk AND begins_with(SK, :p)",
+        ExpressionAttributeValues={
+            ":pk": {"S": PK_BY_SHARD[s]},
+            ":p": {"S": SK_PREFIX},
+        },
+        Limit=5,  # the global top 5 can't need more than 5 from any shard
+        ProjectionExpression="SK",  # all we display; skips the payload map
     )
-    items.extend(resp["Items"])
+    # Raw AttributeValue maps: unwrap just the string SK, no TypeDeserializer
+    return [{"SK": it["SK"]["S"]} for it in resp["Items"]]
+
+
+# Write across shards round-robin: every shard gets an equal share. Events
+# are built directly as DynamoDB AttributeValues, skipping TypeSerializer's
+# per-value type dispatch, which dominates seed time as EVENTS grows.
+events = [
+    {
+        "PK": {"S": PK_BY_SHARD[s]},
+        "SK": {"S": SK(n, n)},
+        "type": {"S": "EVENT"},
+        "payload": {"M": {"n": {"N": str(n)}, "shard": {"S": s}}},
+    }
+    for n, s in zip(range(EVENTS), cycle(SHARDS))
+]
+
+# One pool serves both the seed and the fan-out, so the reads reuse the
+# threads and keep-alive connections the writes already opened
+with ThreadPoolExecutor(max_workers=WORKERS) as pool:
+    batch_put(pool, events)
+    per_shard = list(pool.map(query_shard, SHARDS))
+
+# Each shard is already sorted newest-first, so a k-way merge yields the
+# global top 5 without sorting (or even concatenating) everything fetched
+newest = heapq.merge(*per_shard, key=itemgetter("SK"))
 
+print("Seeded", len(events), "events across", len(SHARDS), "shards")
 print(
-    "Fetched",
-    len(items),
-    "events across shards; first 5:",
-    sorted(items, key=lambda x: x["SK"], reverse=True)[:5],
+    "Newest 5 (merged from",
+    sum(map(len, per_shard)),
+    "per-shard candidates):",
+    list(islice(newest, 5)),
 )
@@ -1,5 +1,6 @@
 #!/usr/bin/env python3
 import os, boto3
+from botocore.config import Config
 from botocore.exceptions import ClientError
 
 try:
@@ -13,12 +14,21 @@ REGION = os.environ.get("AWS_REGION", "ap-southeast-1")
 TABLE = os.environ.get("SHARED_TABLE", "WorkshopShared")
 OTHER_TENANT = os.environ.get("OTHER_TENANT_ID", "t-999")
 
-tbl = boto3.resource("dynamodb", region_name=REGION).Table(TABLE)
+# AccessDenied is not retryable, so fail fast on the first response
+client = boto3.client(
+    "dynamodb",
+    region_name=REGION,
+    config=Config(retries={"mode": "standard", "max_attempts": 1}),
+)
 try:
     # Attempt to read another tenant's data
     # This should FAIL if ABAC policies are working correctly
-    resp = tbl.get_item(
-        Key={"PK": f"TENANT#{OTHER_TENANT}#USER#u1", "SK": "PROFILE#u1"}
+    resp = client.get_item(
+        TableName=TABLE,
+        Key={
+            "PK": {"S": f"TENANT#{OTHER_TENANT}#USER#u1"},
+            "SK": {"S": "PROFILE#u1"},
+        },
     )
     print("🚨 SECURITY ISSUE - Unexpectedly succeeded:", resp.get("Item"))
     print("This means tenant isolation is NOT working!")
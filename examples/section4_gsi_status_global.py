@@ -1,6 +1,7 @@
 #!/usr/bin/env python3
 import os, boto3
 from boto3.dynamodb.conditions import Key
+from botocore.config import Config
 
 try:
     from dotenv import load_dotenv
@@ -13,12 +14,17 @@ REGION = os.environ.get("AWS_REGION", "ap-southeast-1")
 TABLE = os.environ.get("SHARED_TABLE", "WorkshopShared")
 GSI = os.environ.get("GSI_GLOBAL_STATUS", "GSI2_StatusGlobal")
 
-tbl = boto3.resource("dynamodb", region_name=REGION).Table(TABLE)
+cfg = Config(retries={"mode": "adaptive", "max_attempts": 10})
+tbl = boto3.resource("dynamodb", region_name=REGION, config=cfg).Table(TABLE)
 
 # Admin query: Find ALL pending orders across ALL tenants
 print("Global pending orders across all tenants:")
 print(
-    tbl.query(IndexName=GSI, KeyConditionExpression=Key("GSI2PK").eq("STATUS#PENDING"))[
-        "Items"
-    ]
+    tbl.query(
+        IndexName=GSI,
+        KeyConditionExpression=Key("GSI2PK").eq("STATUS#PENDING"),
+        # Only return what we print ("status" is a reserved word)
+        ProjectionExpression="PK, SK, #s",
+        ExpressionAttributeNames={"#s": "status"},
+    )["Items"]
 )
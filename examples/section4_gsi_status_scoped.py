@@ -1,6 +1,7 @@
 #!/usr/bin/env python3
 import os, boto3
 from boto3.dynamodb.conditions import Key
+from botocore.config import Config
 
 try:
     from dotenv import load_dotenv
@@ -14,11 +15,15 @@ TABLE = os.environ.get("SHARED_TABLE", "WorkshopShared")
 GSI = os.environ.get("GSI_TENANT_STATUS", "GSI1")
 TENANT = os.environ.get("TENANT_ID", "t-037")
 
-tbl = boto3.resource("dynamodb", region_name=REGION).Table(TABLE)
+cfg = Config(retries={"mode": "adaptive", "max_attempts": 10})
+tbl = boto3.resource("dynamodb", region_name=REGION, config=cfg).Table(TABLE)
 
 # Query GSI1 for all PENDING orders in this tenant
 resp = tbl.query(
     IndexName=GSI,
     KeyConditionExpression=Key("GSI1PK").eq(f"TENANT#{TENANT}#STATUS#PENDING"),
+    # Only return what we print ("status" is a reserved word)
+    ProjectionExpression="PK, SK, #s",
+    ExpressionAttributeNames={"#s": "status"},
 )
 print("Pending orders for", TENANT, "->", resp["Items"])
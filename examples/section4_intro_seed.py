@@ -1,39 +1,56 @@
 #!/usr/bin/env python3
 import os, boto3
 from boto3.dynamodb.conditions import Key
+from botocore.config import Config
 
-try:
-    from dotenv import load_dotenv
+ENV_VARS = {"AWS_PROFILE", "AWS_REGION", "SHARED_TABLE", "TENANT_ID"}
+if not ENV_VARS <= os.environ.keys():
+    try:
+        from dotenv import load_dotenv
 
-    load_dotenv()
-except Exception:
-    pass
+        load_dotenv()
+    except Exception:
+        pass
 
 REGION = os.environ.get("AWS_REGION", "ap-southeast-1")
 TABLE = os.environ.get("SHARED_TABLE", "WorkshopShared")
 TENANT = os.environ.get("TENANT_ID", "t-037")
 
-ddb = boto3.resource("dynamodb", region_name=REGION)
+cfg = Config(retries={"mode": "adaptive", "max_attempts": 10})
+ddb = boto3.resource("dynamodb", region_name=REGION, config=cfg)
 tbl = ddb.Table(TABLE)
+# Reuse the resource's client (one connection pool); it takes and returns
+# plain Python values, serializing to AttributeValues itself
+client = ddb.meta.client
+
+
+def transact_put(items):
+    # Small seed (TransactWriteItems allows up to 100 items): one atomic call,
+    # so the profile and its orders are all written or none are. It rejects
+    # a request that repeats a key, so keep the last put per PK/SK (what
+    # batch_writer's overwrite_by_pkeys does)
+    items = {(item["PK"], item["SK"]): item for item in items}.values()
+    client.transact_write_items(
+        TransactItems=[{"Put": {"TableName": TABLE, "Item": item}} for item in items]
+    )
+
 
 # Key generation functions - notice the tenant prefix in every PK
 PK = lambda uid: f"TENANT#{TENANT}#USER#{uid}"
 SKP = lambda uid: f"PROFILE#{uid}"
 SKO = lambda d, oid: f"ORDER#{d}#{oid}"
 
-with tbl.batch_writer() as bw:
-    # User profile item
-    bw.put_item(
-        Item={
+transact_put(
+    [
+        # User profile item
+        {
             "PK": PK("u1"),  # TENANT#t-037#USER#u1
             "SK": SKP("u1"),  # PROFILE#u1
             "type": "USER",
             "email": "u1@example.org",
-        }
-    )
-    # Order 1 - includes GSI1 attributes for status queries
-    bw.put_item(
-        Item={
+        },
+        # Order 1 - includes GSI1 attributes for status queries
+        {
             "PK": PK("u1"),  # Same PK groups user and orders
             "SK": SKO("20250928", "o1"),  # ORDER#20250928#o1
             "type": "ORDER",
@@ -41,19 +58,18 @@ with tbl.batch_writer() as bw:
             # GSI1 attributes for tenant-scoped status queries
             "GSI1PK": f"TENANT#{TENANT}#STATUS#PENDING",
             "GSI1SK": "20250928#o1",
-        }
-    )
-    # Order 2 - different status
-    bw.put_item(
-        Item={
+        },
+        # Order 2 - different status
+        {
             "PK": PK("u1"),
             "SK": SKO("20250929", "o2"),
             "type": "ORDER",
             "status": "SHIPPED",
             "GSI1PK": f"TENANT#{TENANT}#STATUS#SHIPPED",
             "GSI1SK": "20250929#o2",
-        }
-    )
+        },
+    ]
+)
 
 print("Seeded namespace for", TENANT, "in", TABLE)
 # Query all items for this user (profile + orders in one query)
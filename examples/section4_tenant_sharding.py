@@ -1,48 +1,95 @@
 #!/usr/bin/env python3
-import os, random, boto3
-from boto3.dynamodb.conditions import Key
+import os, time, boto3
+from concurrent.futures import ThreadPoolExecutor
+from itertools import cycle
+from botocore.config import Config
 
-try:
-    from dotenv import load_dotenv
+ENV_VARS = {"AWS_PROFILE", "AWS_REGION", "SHARED_TABLE", "TENANT_ID"}
+if not ENV_VARS <= os.environ.keys():
+    try:
+        from dotenv import load_dotenv
 
-    load_dotenv()
-except Exception:
-    pass
+        load_dotenv()
+    except Exception:
+        pass
 
 REGION = os.environ.get("AWS_REGION", "ap-southeast-1")
 TABLE = os.environ.get("SHARED_TABLE", "WorkshopShared")
 TENANT = os.environ.get("TENANT_ID", "t-037")
 SHARDS = ["S0", "S1", "S2", "S3"]  # 4 shards to distribute load
+EVENTS = 120
+WORKERS = 5  # concurrent requests; >= len(SHARDS) so all shards are read at once
 
-tbl = boto3.resource("dynamodb", region_name=REGION).Table(TABLE)
+# One thread-safe client shared by every worker, as in Section 3
+cfg = Config(
+    max_pool_connections=WORKERS,
+    retries={"mode": "adaptive", "max_attempts": 10},
+    tcp_keepalive=True,
+)
+client = boto3.client("dynamodb", region_name=REGION, config=cfg)
 
-# Sharded PK pattern: includes shard suffix
-PK = lambda s: f"TENANT#{TENANT}#USER#hot#{s}"
+# Sharded PK pattern: includes shard suffix (one key per shard, built once)
+PK_BY_SHARD = {s: f"TENANT#{TENANT}#USER#hot#{s}" for s in SHARDS}
 SK = lambda t, n: f"EVENT#{t:010d}#{n:06d}"
 
-# Write phase: Distribute writes across shards randomly
-print(f"Writing 120 events across {len(SHARDS)} shards...")
-with tbl.batch_writer() as bw:
-    for n in range(120):
-        s = random.choice(SHARDS)  # Random shard selection
-        bw.put_item(
-            Item={
-                "PK": PK(s),  # TENANT#t-037#USER#hot#S0
-                "SK": SK(n, n),  # EVENT#0000000001#000001
-                "type": "EVENT",
-                "payload": {"n": n, "shard": s},
-            }
-        )
-
-# Read phase: Fan-out queries across all shards
-print("Reading from all shards...")
-items = []
-for s in SHARDS:
-    shard_items = tbl.query(
-        KeyConditionExpression=Key("PK").eq(PK(s)),
+
+def write_batch(reqs):
+    # Retry leftovers with backoff until DynamoDB has processed the whole batch
+    pending = {TABLE: reqs}
+    for attempt in range(8):
+        if attempt:  # back off before each retry, not after the last try
+            time.sleep(2 ** (attempt - 1) * 0.05)
+        pending = client.batch_write_item(RequestItems=pending)["UnprocessedItems"]
+        if not pending:
+            return
+    raise RuntimeError(f"Unprocessed items left after retries: {pending}")
+
+
+def batch_put(pool, items):
+    # BatchWriteItem takes up to 25 puts per call; send the batches in parallel.
+    reqs = [{"PutRequest": {"Item": item}} for item in items]
+    batches = [reqs[i : i + 25] for i in range(0, len(reqs), 25)]
+    list(pool.map(write_batch, batches))  # re-raises any batch failure
+
+
+# One shard's events; the read phase runs these queries in parallel
+def query_shard(s):
+    return client.query(
+        TableName=TABLE,
+        KeyConditionExpression="PK = :pk",
+        ExpressionAttributeValues={":pk": {"S": PK_BY_SHARD[s]}},
         ScanIndexForward=False,  # Newest first
         Limit=50,
+        ProjectionExpression="SK",  # we only count items; skip the payload
     )["Items"]
+
+
+# Items are built directly as DynamoDB AttributeValues (no TypeSerializer)
+events = [
+    {
+        "PK": {"S": PK_BY_SHARD[s]},  # TENANT#t-037#USER#hot#S0
+        "SK": {"S": SK(n, n)},  # EVENT#0000000001#000001
+        "type": {"S": "EVENT"},
+        "payload": {"M": {"n": {"N": str(n)}, "shard": {"S": s}}},
+    }
+    # Round-robin: S0, S1, S2, S3, S0, ...
+    for n, s in zip(range(EVENTS), cycle(SHARDS))
+]
+
+# One pool serves both phases, so the reads reuse the threads and keep-alive
+# connections the writes already opened
+with ThreadPoolExecutor(max_workers=WORKERS) as pool:
+    # Write phase: Distribute writes evenly across shards
+    print(f"Writing {EVENTS} events across {len(SHARDS)} shards...")
+    batch_put(pool, events)  # 25 items per BatchWriteItem call
+
+    # Read phase: Fan-out queries across all shards in parallel
+    print("Reading from all shards...")
+    # All shards in flight at once: total latency ~ slowest shard, not the sum
+    per_shard = list(pool.map(query_shard, SHARDS))
+
+items = []
+for s, shard_items in zip(SHARDS, per_shard):
     items.extend(shard_items)
     print(f"  Shard {s}: {len(shard_items)} items")
 